@@ -12,6 +12,9 @@ from datetime import datetime
 from uuid import UUID
 from enum import Enum
 
+# All enums subclass str: members *are* their wire values, so Pydantic/orjson emit them
+# without a .value lookup. Do not convert to IntEnum - the API contract is the string form.
+
 # Generic type for paginated responses
 T = TypeVar('T')
 